@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import logging
+
 from abc import ABCMeta
 from typing import TYPE_CHECKING, Any, cast, no_type_check
 
 from PyQt6 import sip
 from yaml import AliasEvent, SafeLoader, ScalarNode, YAMLObject, YAMLObjectMetaclass
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
 
 try:
     from yaml import CDumper as yaml_Dumper
@@ -26,6 +30,8 @@ __all__ = [
     'yaml_Loader',
 ]
 
+logger = logging.getLogger(__name__)
+
 
 class SaferLoader(SafeLoader):     # type: ignore
     def compose_node(self, parent, index):
@@ -37,7 +43,28 @@ class SaferLoader(SafeLoader):     # type: ignore
                 return ScalarNode("tag:yaml.org,2002:null", "null")
         return super().compose_node(parent, index)
 
-yaml_Loader = SaferLoader
+
+# own registry, shared with the libyaml loader below so constructors only need to be added once
+SaferLoader.yaml_constructors = SafeLoader.yaml_constructors.copy()
+SaferLoader.yaml_multi_constructors = SafeLoader.yaml_multi_constructors.copy()
+
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    logger.warning('PyYAML was built without libyaml, loading and saving storages will be slow!')
+
+    yaml_Loader = SaferLoader
+else:
+    class SaferCLoader(CParser, SafeConstructor, Resolver):  # type: ignore
+        yaml_constructors = SaferLoader.yaml_constructors
+        yaml_multi_constructors = SaferLoader.yaml_multi_constructors
+
+        def __init__(self, stream: Any) -> None:
+            CParser.__init__(self, stream)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+    yaml_Loader = SaferCLoader  # type: ignore
 
 
 class SingletonMeta(type):
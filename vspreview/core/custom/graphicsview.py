@@ -129,15 +129,24 @@ class GraphicsScene(QGraphicsScene):
         self.main = self.view.main
 
         self.graphics_items = list[GraphicsImageItem]()
+        self.visible_item: GraphicsImageItem | None = None
 
         super().__init__(self.main)
 
+        # one pixmap item per output, a BSP index only adds bookkeeping on every pixmap change
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
     def init_scenes(self) -> None:
         self.clear()
         self.graphics_items.clear()
+        self.visible_item = None
+
+        # QPixmap is implicitly shared, every placeholder can point at the same null one
+        empty_pixmap = QPixmap()
+        add_pixmap = self.addPixmap
 
         for _ in range(len(self.main.outputs)):
-            raw_frame_item = self.addPixmap(QPixmap())
+            raw_frame_item = add_pixmap(empty_pixmap)
             raw_frame_item.hide()
 
             self.graphics_items.append(GraphicsImageItem(raw_frame_item))
@@ -187,10 +196,19 @@ class GraphicsView(QGraphicsView):
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
 
+        # the scene only ever holds plain pixmap items
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
+
         if self.main.settings.opengl_rendering_enabled:
             from PyQt6.QtOpenGLWidgets import QOpenGLWidget
             self.setViewport(QOpenGLWidget())
 
+            # a GL viewport always repaints fully, computing the minimal region is wasted work
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
         self.wheelScrolled.connect(self.on_wheel_scrolled)
         self.main.reload_before_signal.connect(self.beforeReload)
         self.main.reload_after_signal.connect(self.afterReload)
@@ -232,11 +250,18 @@ class GraphicsView(QGraphicsView):
             self.setZoom(self.zoom_combobox.currentData())
 
     def setup_view(self) -> None:
-        for item in self.graphics_scene.graphics_items:
-            item.hide()
+        current_scene = self.current_scene
+        visible_item = self.graphics_scene.visible_item
+
+        # items start hidden, so only the previously shown one has to be hidden again
+        if visible_item is not current_scene:
+            if visible_item is not None:
+                visible_item.hide()
+
+            current_scene.show()
+            self.graphics_scene.visible_item = current_scene
 
-        self.current_scene.show()
-        self.graphics_scene.setSceneRect(QRectF(self.current_scene.pixmap().rect()))
+        self.graphics_scene.setSceneRect(QRectF(current_scene.pixmap().rect()))
 
     def bind_to(self, other_view: GraphicsView, *, mutual: bool = True) -> None:
         self.main.bound_graphics_views[other_view].add(self)
@@ -33,6 +33,13 @@ class StatusBar(QStatusBar):
         super().__init__(parent)
 
         self.permament_start_index = 0
+        self.label_texts = dict[QLabel, str]()
+
+    def set_label_text(self, label: QLabel, text: str) -> None:
+        # skip the round trip into Qt when the label already shows this text
+        if self.label_texts.get(label) != text:
+            self.label_texts[label] = text
+            label.setText(text)
 
     def addPermanentWidget(self, widget: QWidget, stretch: int = 0) -> None:
         self.insertPermanentWidget(self.permament_start_index, widget, stretch)
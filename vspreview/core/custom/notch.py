@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterable, Iterator, Sequence, TypeVar, cast
 
+import numpy as np
+
+from numpy.typing import NDArray
 from PyQt6.QtCore import QLineF, Qt, QRectF
 from PyQt6.QtGui import QColor
 from vstools import fallback
@@ -19,6 +22,8 @@ __all__ = [
 
 
 class Notch:
+    __slots__ = ('data', '_is_frame', 'color', 'label', 'line')
+
     def __init__(
         self, data: int | Frame | Time, color: QColor | Qt.GlobalColor | None = None,
         label: str | None = None, line: QLineF = QLineF()
@@ -27,6 +32,7 @@ class Notch:
             data = Frame(data)
 
         self.data = data
+        self._is_frame = isinstance(data, Frame)
         self.color = cast(QColor, fallback(color, Qt.GlobalColor.white))
         self.label = fallback(label, '')
         self.line = line
@@ -72,9 +78,17 @@ class Notches:
         color: QColor | Qt.GlobalColor | None = None, label: str | None = None
     ) -> None:
         self.items = list[Notch]()
+        self._owned = True
+        self._gen = 0
+        self._positions: tuple[NDArray[np.float64], NDArray[np.bool_]] | None = None
+        self._sorted_xs: tuple[NDArray[np.float64], NDArray[np.intp]] | None = None
+        self._lines_key: tuple[float, ...] | None = None
 
         if isinstance(other, Notches):
-            self.items = list(other.items)
+            # share the list (and its positions) until either side gets modified or lays out its lines
+            self.items = other.items
+            self._owned = other._owned = False
+            self._positions = other._positions
             return
 
         if isinstance(other, Sequence):
@@ -84,7 +98,51 @@ class Notches:
     def add(
         self, data: NotchT, color: QColor | Qt.GlobalColor | None = None, label: str | None = None
     ) -> None:
+        self._own()
         self.items.extend(Notch.from_param(data, color, label))
+        self._changed()
+
+    def add_frame(
+        self, frame: int | Frame, color: QColor | Qt.GlobalColor | None = None, label: str | None = None
+    ) -> None:
+        self._own()
+        self.items.append(Notch(frame, color, label))
+        self._changed()
+
+    def add_time(self, time: Time, color: QColor | Qt.GlobalColor | None = None, label: str | None = None) -> None:
+        self._own()
+        self.items.append(Notch(time, color, label))
+        self._changed()
+
+    def add_scene(self, scene: Scene, color: QColor | Qt.GlobalColor | None = None, label: str | None = None) -> None:
+        label = label or scene.label
+
+        self._own()
+        self.items.append(Notch(scene.start, color, label))
+
+        if scene.end != scene.start:
+            self.items.append(Notch(scene.end, color, label))
+
+        self._changed()
+
+    def pop(self, index: int = -1) -> Notch:
+        self._own()
+        notch = self.items.pop(index)
+        self._changed()
+
+        return notch
+
+    def _own(self) -> None:
+        if not self._owned:
+            # norm_lines writes each notch's line, so the notches themselves can't stay shared either
+            self.items = [Notch(notch.data, notch.color, notch.label, notch.line) for notch in self.items]
+            self._owned = True
+
+    def _changed(self) -> None:
+        self._gen += 1
+        self._positions = None
+        self._sorted_xs = None
+        self._lines_key = None
 
     def __len__(self) -> int:
         return len(self.items)
@@ -98,46 +156,55 @@ class Notches:
     def __repr__(self) -> str:
         return '{}({})'.format(type(self).__name__, repr(self.items))
 
+    def positions(self) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """Notch values (frames or seconds) and a mask of which ones are frames, built once per change."""
+
+        if self._positions is None:
+            self._positions = (
+                np.fromiter((float(notch.data) for notch in self.items), np.float64, len(self.items)),
+                np.fromiter((notch._is_frame for notch in self.items), np.bool_, len(self.items))
+            )
+
+        return self._positions
+
     def norm_lines(self, timeline: Timeline, rect: QRectF) -> None:
-        from ...main.timeline import Timeline
+        if not self.items:
+            return
 
         y = rect.top()
         y_t = y + rect.height() - 1
 
-        # fastpaths for Notches that match Timeline.Mode
-        if timeline.mode == Timeline.Mode.FRAME:
-            try:
-                for notch in self:
-                    x = timeline.c_to_x(notch.data)  # type: ignore
-                    notch.line = QLineF(x, y, x, y_t)
-                return
-            except Exception:
-                try:
-                    for notch in self:
-                        x = timeline.t_to_x(notch.data)  # type: ignore
-                        notch.line = QLineF(x, y, x, y_t)
-                    return
-                except Exception:
-                    ...
-        else:
-            try:
-                for notch in self:
-                    x = timeline.t_to_x(notch.data)  # type: ignore
-                    notch.line = QLineF(x, y, x, y_t)
-                return
-            except Exception:
-                try:
-                    for notch in self:
-                        x = timeline.c_to_x(notch.data)  # type: ignore
-                        notch.line = QLineF(x, y, x, y_t)
-                    return
-                except Exception:
-                    ...
-
-        for notch in self:
-            if isinstance(notch.data, Frame):
-                x = timeline.c_to_x(notch.data)
-            elif isinstance(notch.data, Time):
-                x = timeline.t_to_x(notch.data)
+        lines_key = (self._gen, y, y_t, timeline.x_scale_f, timeline.x_scale_t)
+
+        # the lines of unchanged notches only need rebuilding when the geometry changes
+        if lines_key == self._lines_key:
+            return
+
+        self._own()
+
+        values, is_frame = self.positions()
+
+        # same rounding as Timeline.c_to_x, but for every notch at once
+        xs = np.where(is_frame, np.rint(values * timeline.x_scale_f), np.floor(values * timeline.x_scale_t))
 
+        for notch, x in zip(self.items, xs.tolist()):
             notch.line = QLineF(x, y, x, y_t)
+
+        order = np.argsort(xs, kind='stable')
+        self._sorted_xs = (xs[order], order)
+        self._lines_key = lines_key
+
+    def notch_at(self, x: float, tolerance: float = 0.5) -> Notch | None:
+        """Find the notch drawn within tolerance of x, using the positions from the last norm_lines."""
+
+        if self._sorted_xs is None:
+            return None
+
+        xs, order = self._sorted_xs
+
+        idx = int(np.searchsorted(xs, x - tolerance, 'left'))
+
+        if idx < len(xs) and xs[idx] <= x + tolerance:
+            return self.items[int(order[idx])]
+
+        return None
@@ -117,6 +117,23 @@ class VideoOutput(AbstractYAMLObject):
     _stateset: bool
     props: vs.FrameProps | None
 
+    def _build_statusbar_texts(self) -> tuple[str, str, str, str, str]:
+        # built once per setValue, formatting every distinct VFR timecode isn't free
+        fmt = self.source.clip.format
+        assert fmt
+
+        if self.got_timecodes:
+            fps_text = f'VFR {",".join(f"{float(fps):.3f}" for fps in self.unique_timecodes)} fps '
+        elif self.fps_den != 0:
+            fps_text = f'{self.fps_num}/{self.fps_den} = {self.fps_num / self.fps_den:.3f} fps '
+        else:
+            fps_text = f'VFR {self.fps_num}/{self.fps_den} fps '
+
+        return (
+            f'{self.total_frames} frames ', f'{self.total_time} ', f'{self.width}x{self.height} ', f'{fmt.name} ',
+            fps_text
+        )
+
     def clear(self) -> None:
         if self.source:
             del self.source.clip, self.source.alpha
@@ -242,12 +259,15 @@ class VideoOutput(AbstractYAMLObject):
         if index in self.main.norm_timecodes:
             norm_timecodes = self.main.norm_timecodes[index]  # type: ignore
 
-            if (vfr := len(set(norm_timecodes)) > 1) or self.fps_num == 0:
+            unique_timecodes = set(norm_timecodes)
+
+            if (vfr := len(unique_timecodes) > 1) or self.fps_num == 0:
                 if not self.main.toolbars.playback.fps_variable_checkbox.isChecked():
                     self.main.toolbars.playback.fps_variable_checkbox.setChecked(True)
 
             self.got_timecodes = vfr
             self.timecodes = norm_timecodes
+            self.unique_timecodes = sorted(unique_timecodes, reverse=True)
         else:
             self.got_timecodes = False
 
@@ -261,6 +281,8 @@ class VideoOutput(AbstractYAMLObject):
         else:
             self.total_time = self.to_time(self.total_frames)
 
+        self.statusbar_texts = self._build_statusbar_texts()
+
         if not hasattr(self, 'crop_values'):
             self.crop_values = CroppingInfo(0, 0, self.width, self.height, False, False)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from functools import partial
 from multiprocessing import cpu_count
-from typing import Any, cast
+from typing import Any
 
 from PyQt6.QtCore import QKeyCombination, Qt
 from PyQt6.QtGui import QShortcut
@@ -56,6 +56,8 @@ class MainSettings(AbstractToolbarSettings):
         self.png_compressing_spinbox = SpinBox(self, 0, 100)
 
         self.statusbar_timeout_control = TimeEdit(self)
+        self.statusbar_timeout_control.valueChanged.connect(self.on_statusbar_timeout_changed)
+        self.on_statusbar_timeout_changed(self.statusbar_timeout_control.value())
 
         self.timeline_notches_margin_spinbox = SpinBox(self, 1, 9999, '%')
 
@@ -174,6 +176,10 @@ class MainSettings(AbstractToolbarSettings):
     def statusbar_message_timeout(self) -> Time:
         return self.statusbar_timeout_control.value()
 
+    def on_statusbar_timeout_changed(self, new_value: Time, old_value: Time | None = None) -> None:
+        # show_message runs a lot, keep the timeout in the milliseconds Qt wants
+        self.statusbar_message_timeout_ms = round(float(new_value) * 1000)
+
     @property
     def timeline_label_notches_margin(self) -> int:
         return self.timeline_notches_margin_spinbox.value()
@@ -351,8 +357,8 @@ class WindowSettings(QYAMLObjectSingleton):
 
         return {
             'timeline_mode': main.timeline.mode,
-            'window_geometry': bytes(cast(bytearray, main.saveGeometry())),
-            'window_state': bytes(cast(bytearray, main.saveState())),
+            'window_geometry': main.saveGeometry().data(),
+            'window_state': main.saveState().data(),
             'zoom_index': main.graphics_view.zoom_combobox.currentIndex(),
             'x_pos': main.graphics_view.horizontalScrollBar().value(),
             'y_pos': main.graphics_view.verticalScrollBar().value(),
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from bisect import bisect_right
+from datetime import timedelta
+from functools import lru_cache
 from math import floor
 from typing import Any, Iterable, Sequence, cast
 from time import perf_counter_ns
 
-from PyQt6.QtCore import QEvent, QLineF, QRectF, Qt, pyqtSignal
-from PyQt6.QtGui import QMouseEvent, QMoveEvent, QPainter, QPaintEvent, QPalette, QPen, QResizeEvent
+from PyQt6.QtCore import QEvent, QLineF, QRectF, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QColor, QMouseEvent, QMoveEvent, QPainter, QPaintEvent, QPalette, QPen, QPixmap, QResizeEvent, QShowEvent
+)
 from PyQt6.QtWidgets import QApplication, QToolTip, QWidget
 from vstools import to_arr
 
@@ -43,12 +47,25 @@ class Timeline(QWidget):
         self._mode = self.Mode.TIME
 
         self.rect_f = QRectF()
+        self.x_scale_f = self.x_scale_t = 0.0
+
+        self._bg_pixmap = QPixmap()
+        self._bg_pixmap_key: tuple[Any, ...] | None = None
+        self._pen_cache = dict[int | Qt.GlobalColor, QPen]()
+
+        self.update_palette_cache()
+
+        self._notch_intervals_margin: float | None = None
+        self._scaled_notch_intervals = (list[float](), list[int]())
 
         self.set_sizes()
 
         self._cursor_x: int | Frame | Time = 0
 
         self.notches = dict[NotchProvider, Notches]()
+        self._pending_notches = dict[NotchProvider, None]()
+        self._notches_flush_scheduled = False
+        self._any_notches_visible = False
 
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setMouseTracking(True)
@@ -80,7 +97,8 @@ class Timeline(QWidget):
         self.update()
 
     def set_sizes(self) -> None:
-        self.notches_cache = _default_cache
+        self.notches_cache = dict(_default_cache)
+        self._bg_pixmap_key = None
 
         self.notch_interval_target_x = round(75 * self.main.display_scale)
         self.notch_height = round(6 * self.main.display_scale)
@@ -103,106 +121,180 @@ class Timeline(QWidget):
         self.drawWidget(QPainter(self))
 
     def drawWidget(self, painter: QPainter) -> None:
+        self.update_scales()
+
         setup_key = (self.rect_f, self.main.current_output.index)
 
         curr_key, (scroll_rect, labels_notches, rects_to_draw) = self.notches_cache[self.mode]
 
-        if setup_key != curr_key:
-            lnotch_y, lnotch_x = self.rect_f.top() + self.font_height + self.notch_height + 5, self.rect_f.left()
-            lnotch_top = lnotch_y - self.notch_height
+        dpr = self.devicePixelRatioF()
 
-            labels_notches = Notches()
+        # a screen with another pixel ratio needs the pixmap rendered again even at the same size
+        bg_key = (setup_key, self.mode, dpr)
 
-            if self.mode == self.Mode.TIME:
-                max_value = self.main.current_output.total_time
-                notch_interval = self.calculate_notch_interval_t(self.notch_interval_target_x)
-                label_format = self.generate_label_format(notch_interval, max_value)
-                label_notch = Time()
-            elif self.mode == self.Mode.FRAME:
-                max_value = self.main.current_output.total_frames - 1  # type: ignore
-                notch_interval = self.calculate_notch_interval_f(self.notch_interval_target_x)  # type: ignore
-                label_notch = Frame()  # type: ignore
+        if setup_key != curr_key or bg_key != self._bg_pixmap_key:
+            # labels, ticks and scroll bar only depend on size, output, mode and palette,
+            # so they're rendered once to a pixmap and blitted on every other paint
 
-            while (lnotch_x < self.rect_f.right() and label_notch <= max_value):
-                labels_notches.add(
-                    Notch(deepcopy(label_notch), line=QLineF(lnotch_x, lnotch_y, lnotch_x, lnotch_top))
-                )
-                label_notch += notch_interval
-                lnotch_x = self.c_to_x(label_notch)
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(self.background_color)
 
-            labels_notches.add(
-                Notch(max_value, line=QLineF(self.rect_f.right() - 1, lnotch_y, self.rect_f.right() - 1, lnotch_top))
-            )
+            bg_painter = QPainter(pixmap)
+            bg_painter.setFont(self.font())
 
-            scroll_rect = QRectF(
-                self.rect_f.left(), lnotch_y + self.notch_scroll_interval, self.rect_f.width(), self.scroll_height
-            )
+            try:
+                if setup_key != curr_key:
+                    scroll_rect, labels_notches, rects_to_draw = self.setup_labels(bg_painter)
+
+                    self.notches_cache[self.mode] = (setup_key, (scroll_rect, labels_notches, rects_to_draw))
+
+                self.draw_labels(bg_painter, scroll_rect, labels_notches, rects_to_draw)
+            finally:
+                bg_painter.end()
+
+            self._bg_pixmap, self._bg_pixmap_key = pixmap, bg_key
 
         cursor_line = QLineF(
             self.cursor_x, scroll_rect.top(), self.cursor_x, scroll_rect.top() + scroll_rect.height() - 1
         )
 
-        for provider, notches in self.notches.items():
-            if not provider.is_notches_visible:
-                continue
+        visible_notches = [notches for provider, notches in self.notches.items() if provider.is_notches_visible]
 
+        self._any_notches_visible = bool(visible_notches)
+
+        for notches in visible_notches:
             notches.norm_lines(self, scroll_rect)
 
-        painter.fillRect(self.rect_f, self.palette().color(QPalette.ColorRole.Window))
-        painter.setPen(QPen(self.palette().color(QPalette.ColorRole.WindowText)))
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+        for notches in visible_notches:
+            last_color = None
+
+            for notch in notches:
+                if notch.color is not last_color:
+                    painter.setPen(self.get_pen(notch.color))
+                    last_color = notch.color
+
+                painter.drawLine(notch.line)
+
+        painter.setPen(Qt.GlobalColor.black)
+        painter.drawLine(cursor_line)
+
+    def update_palette_cache(self) -> None:
+        palette = self.palette()
+
+        self.background_color = palette.color(QPalette.ColorRole.Window)
+        self.text_pen = QPen(palette.color(QPalette.ColorRole.WindowText))
+
+        self._bg_pixmap_key = None
+        self._pen_cache.clear()
+
+    def get_pen(self, color: QColor | Qt.GlobalColor) -> QPen:
+        key = color if isinstance(color, Qt.GlobalColor) else color.rgba()
+
+        if (pen := self._pen_cache.get(key)) is None:
+            pen = self._pen_cache[key] = QPen(color)
+
+        return pen
+
+    def setup_labels(self, painter: QPainter) -> tuple[QRectF, Notches, list[tuple[QRectF, str]]]:
+        lnotch_y, lnotch_x = self.rect_f.top() + self.font_height + self.notch_height + 5, self.rect_f.left()
+        lnotch_top = lnotch_y - self.notch_height
+
+        # every tick is the same vertical line, only shifted horizontally
+        tick_line = QLineF(0, lnotch_y, 0, lnotch_top)
+
+        labels_notches = Notches()
+
+        if self.mode == self.Mode.TIME:
+            max_value = self.main.current_output.total_time
+            notch_interval = self.calculate_notch_interval_t(self.notch_interval_target_x)
+            label_format = self.generate_label_format(notch_interval, max_value)
+            label_notch = Time()
+            x_step, to_x = float(notch_interval) * self.x_scale_t, floor
+        elif self.mode == self.Mode.FRAME:
+            max_value = self.main.current_output.total_frames - 1  # type: ignore
+            notch_interval = self.calculate_notch_interval_f(self.notch_interval_target_x)  # type: ignore
+            label_notch = Frame()  # type: ignore
+            x_step, to_x = int(notch_interval) * self.x_scale_f, round
+
+        i = 0
+
+        while (lnotch_x < self.rect_f.right() and label_notch <= max_value):
+            labels_notches.add(
+                Notch(label_notch, line=tick_line.translated(lnotch_x, 0))
+            )
+            # rebind instead of += so the stored notch keeps its own value without copying
+            label_notch = label_notch + notch_interval
+            i += 1
+            # multiply from the start rather than accumulating, so rounding doesn't drift
+            lnotch_x = to_x(i * x_step)
+
+        labels_notches.add(
+            Notch(max_value, line=tick_line.translated(self.rect_f.right() - 1, 0))
+        )
 
-        if setup_key != curr_key:
-            rects_to_draw = []
+        scroll_rect = QRectF(
+            self.rect_f.left(), lnotch_y + self.notch_scroll_interval, self.rect_f.width(), self.scroll_height
+        )
 
-            for i, notch in enumerate(labels_notches):
-                anchor_rect = QRectF(notch.line.x2(), notch.line.y2(), 0, 0)
+        rects_to_draw = list[tuple[QRectF, str]]()
 
+        for i, notch in enumerate(labels_notches):
+            anchor_rect = QRectF(notch.line.x2(), notch.line.y2(), 0, 0)
+
+            if self.mode == self.Mode.TIME:
+                label = _format_time_label(label_format, cast(Time, notch.data).value)
+            elif self.mode == self.Mode.FRAME:
+                label = str(notch.data)
+
+            if i == 0:
+                rect = painter.boundingRect(
+                    anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, label
+                )
                 if self.mode == self.Mode.TIME:
-                    time = cast(Time, notch.data)
-                    label = strfdelta(time, label_format)
+                    rect.moveLeft(-2.5)
+            elif i == (len(labels_notches) - 1):
+                rect = painter.boundingRect(
+                    anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, label
+                )
+            elif i == (len(labels_notches) - 2):
+                rect = painter.boundingRect(
+                    anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, label
+                )
+
+                last_notch = labels_notches[-1]
+
+                if self.mode == self.Mode.TIME:
+                    last_label = _format_time_label(label_format, cast(Time, last_notch.data).value)
                 elif self.mode == self.Mode.FRAME:
-                    label = str(notch.data)
-
-                if i == 0:
-                    rect = painter.boundingRect(
-                        anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, label
-                    )
-                    if self.mode == self.Mode.TIME:
-                        rect.moveLeft(-2.5)
-                elif i == (len(labels_notches) - 1):
-                    rect = painter.boundingRect(
-                        anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, label
-                    )
-                elif i == (len(labels_notches) - 2):
-                    rect = painter.boundingRect(
-                        anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, label
-                    )
-
-                    last_notch = labels_notches[-1]
-
-                    if self.mode == self.Mode.TIME:
-                        last_label = strfdelta(cast(Time, last_notch.data), label_format)
-                    elif self.mode == self.Mode.FRAME:
-                        last_label = str(last_notch.data)
-
-                    anchor_rect = QRectF(last_notch.line.x2(), last_notch.line.y2(), 0, 0)
-                    last_rect = painter.boundingRect(
-                        anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, last_label
-                    )
-
-                    if last_rect.left() - rect.right() < self.notch_interval_target_x / 10:
-                        labels_notches.items.pop(-2)
-                        rects_to_draw.append((last_rect, last_label))
-                        break
-                else:
-                    rect = painter.boundingRect(
-                        anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, label
-                    )
-
-                rects_to_draw.append((rect, label))
-
-                self.notches_cache[self.mode] = (setup_key, (scroll_rect, labels_notches, rects_to_draw))
+                    last_label = str(last_notch.data)
+
+                anchor_rect = QRectF(last_notch.line.x2(), last_notch.line.y2(), 0, 0)
+                last_rect = painter.boundingRect(
+                    anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, last_label
+                )
+
+                if last_rect.left() - rect.right() < self.notch_interval_target_x / 10:
+                    labels_notches.pop(-2)
+                    rects_to_draw.append((last_rect, last_label))
+                    break
+            else:
+                rect = painter.boundingRect(
+                    anchor_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, label
+                )
+
+            rects_to_draw.append((rect, label))
+
+        return scroll_rect, labels_notches, rects_to_draw
+
+    def draw_labels(
+        self, painter: QPainter, scroll_rect: QRectF, labels_notches: Notches, rects_to_draw: list[tuple[QRectF, str]]
+    ) -> None:
+        painter.fillRect(self.rect_f, self.background_color)
+        painter.setPen(self.text_pen)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         for rect, text in rects_to_draw:
             painter.drawText(rect, text)
@@ -211,17 +303,6 @@ class Timeline(QWidget):
         painter.drawLines([notch.line for notch in labels_notches])  # type: ignore
         painter.fillRect(scroll_rect, Qt.GlobalColor.gray)
 
-        for provider, notches in self.notches.items():
-            if not provider.is_notches_visible:
-                continue
-
-            for notch in notches:
-                painter.setPen(notch.color)
-                painter.drawLine(notch.line)
-
-        painter.setPen(Qt.GlobalColor.black)
-        painter.drawLine(cursor_line)
-
     def moveEvent(self, event: QMoveEvent) -> None:
         super().moveEvent(event)
         self.update()
@@ -249,15 +330,23 @@ class Timeline(QWidget):
                 self.clicked.emit(self.x_to_f(self.cursor_x), self.x_to_t(self.cursor_x))
                 self.lastpaint = perf_counter_ns()
 
+        # common case, nothing to show a tooltip for
+        if not self._any_notches_visible:
+            return
+
         for provider, notches in self.notches.items():
             if not provider.is_notches_visible:
                 continue
 
-            for notch in notches:
-                line = notch.line
-                if line.x1() - 0.5 <= event.pos().x() <= line.x1() + 0.5:
-                    QToolTip.showText(event.globalPosition().toPoint(), notch.label)
-                    return
+            if (notch := notches.notch_at(event.pos().x())) is not None:
+                QToolTip.showText(event.globalPosition().toPoint(), notch.label)
+                return
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+
+        if self._pending_notches:
+            self.flush_notches()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
@@ -266,6 +355,7 @@ class Timeline(QWidget):
     def event(self, event: QEvent) -> bool:
         if event.type() in {QEvent.Type.Polish, QEvent.Type.ApplicationPaletteChange}:
             self.setPalette(self.main.palette())
+            self.update_palette_cache()
             self.update()
             return True
 
@@ -275,50 +365,70 @@ class Timeline(QWidget):
         if provider is None:
             provider = [*self.main.toolbars, *self.main.plugins]
 
-        for t in cast(list[NotchProvider], to_arr(provider)):
-            if t.is_notches_visible:
-                self.notches[t] = t.get_notches()
+        self._pending_notches.update(dict.fromkeys(cast(list[NotchProvider], to_arr(provider))))
 
-        self.update()
+        # nothing gets painted while hidden, the notches get collected once we're shown again
+        if not self.isVisible() or self._notches_flush_scheduled:
+            return
 
-    def calculate_notch_interval_t(self, target_interval_x: int) -> Time:
-        notch_intervals_t = list(
-            Time(seconds=n) for n in [
-                1, 2, 5, 10, 15, 30, 60, 90, 120, 300, 600,
-                900, 1200, 1800, 2700, 3600, 5400, 7200
-            ]
-        )
+        # coalesce bursts of notches_changed (e.g. on output switch or reload) into one rebuild
+        self._notches_flush_scheduled = True
+        QTimer.singleShot(0, self.flush_notches)
 
-        margin = 1 + self.main.settings.timeline_label_notches_margin / 100
-        target_interval_t = self.x_to_t(target_interval_x)
+    def flush_notches(self) -> None:
+        self._notches_flush_scheduled = False
 
-        if target_interval_t >= notch_intervals_t[-1] * margin:
-            return notch_intervals_t[-1]
+        if not self.isVisible():
+            return
 
-        for interval in notch_intervals_t:
-            if target_interval_t < interval * margin:
-                return interval
+        pending = list(self._pending_notches)
+        self._pending_notches.clear()
 
-        raise RuntimeError
+        for t in pending:
+            if t.is_notches_visible:
+                self.notches[t] = t.get_notches()
+
+        self._any_notches_visible = any(t.is_notches_visible for t in self.notches)
+
+        self.update()
+
+    notch_intervals_t_seconds = [
+        1, 2, 5, 10, 15, 30, 60, 90, 120, 300, 600,
+        900, 1200, 1800, 2700, 3600, 5400, 7200
+    ]
+    notch_intervals_t = [Time(seconds=n) for n in notch_intervals_t_seconds]
 
-    notch_intervals_f = list(map(Frame, [
+    notch_intervals_f_ints = [
         1, 5, 10, 20, 25, 50, 75, 100, 200, 250, 500, 750, 1000,
         2000, 2500, 5000, 7500, 10000, 20000, 25000, 50000, 75000
-    ]))
+    ]
+    notch_intervals_f = list(map(Frame, notch_intervals_f_ints))
 
-    def calculate_notch_interval_f(self, target_interval_x: int) -> Frame:
+    def get_scaled_notch_intervals(self) -> tuple[list[float], list[int]]:
         margin = 1 + self.main.settings.timeline_label_notches_margin / 100
 
-        target_interval_f = self.x_to_f(target_interval_x)
+        if margin != self._notch_intervals_margin:
+            self._notch_intervals_margin = margin
+            self._scaled_notch_intervals = (
+                [n * margin for n in self.notch_intervals_t_seconds],
+                [round(n * margin) for n in self.notch_intervals_f_ints]
+            )
+
+        return self._scaled_notch_intervals
+
+    def calculate_notch_interval_t(self, target_interval_x: int) -> Time:
+        scaled_t, _ = self.get_scaled_notch_intervals()
+
+        idx = bisect_right(scaled_t, float(self.x_to_t(target_interval_x)))
+
+        return self.notch_intervals_t[min(idx, len(self.notch_intervals_t) - 1)]
 
-        if target_interval_f >= Frame(round(int(self.notch_intervals_f[-1]) * margin)):
-            return self.notch_intervals_f[-1]
+    def calculate_notch_interval_f(self, target_interval_x: int) -> Frame:
+        _, scaled_f = self.get_scaled_notch_intervals()
 
-        for interval in self.notch_intervals_f:
-            if target_interval_f < Frame(round(int(interval) * margin)):
-                return interval
+        idx = bisect_right(scaled_f, int(self.x_to_f(target_interval_x)))
 
-        raise RuntimeError
+        return self.notch_intervals_f[min(idx, len(self.notch_intervals_f) - 1)]
 
     def generate_label_format(self, notch_interval_t: Time, end_time: Time | Time) -> str:
         if end_time >= Time(hours=1):
@@ -338,34 +448,35 @@ class Timeline(QWidget):
     def x_to_f(self, x: int) -> Frame:
         return Frame(round(x / self.rect_f.width() * int(self.main.current_output.total_frames)))
 
+    def update_scales(self) -> None:
+        width = self.rect_f.width()
+        total_frames = int(self.main.current_output.total_frames)
+        total_time = float(self.main.current_output.total_time)
+
+        self.x_scale_f = width / total_frames if total_frames else 0.0
+        self.x_scale_t = width / total_time if total_time else 0.0
+
     def c_to_x(self, cursor: int | Frame | Time) -> int:
         if isinstance(cursor, int):
             return cursor
 
-        try:
-            if isinstance(cursor, Frame):
-                return round(int(cursor) / int(self.main.current_output.total_frames) * self.rect_f.width())
+        if isinstance(cursor, Frame):
+            return round(int(cursor) * self.x_scale_f)
 
-            if isinstance(cursor, Time):
-                return floor(float(cursor) / float(self.main.current_output.total_time) * self.rect_f.width())
-        except ZeroDivisionError:
-            ...
+        if isinstance(cursor, Time):
+            return floor(float(cursor) * self.x_scale_t)
 
         return 0
 
     def cs_to_x(self, *cursors: int | Frame | Time) -> Iterable[int]:
-        r_f = self.rect_f.width()
-        t_d = float(self.main.current_output.total_time) * r_f
-        f_d = int(self.main.current_output.total_frames) * r_f
-
         for c in cursors:
-            if isinstance(c, int):
-                yield c
+            yield self.c_to_x(c)
 
-            try:
-                yield round(int(c) / (f_d if isinstance(c, Time) else t_d))
-            except ZeroDivisionError:
-                yield 0
+
+@lru_cache(maxsize=512)
+def _format_time_label(label_format: str, value: timedelta) -> str:
+    # label values repeat across repaints, resizes and outputs of the same length
+    return strfdelta(Time(value), label_format)
 
 
 _default_cache = {
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import gc
 import io
 import logging
+import os
 import sys
 
+from contextlib import contextmanager
 from fractions import Fraction
 from functools import partial
+from hashlib import blake2b
 from importlib import reload as reload_module
 from time import time
-from typing import Any, Iterable, cast
+from typing import Any, Iterable, Iterator, cast
 
 import vapoursynth as vs
 
 from PyQt6 import QtCore
-from PyQt6.QtCore import QEvent, pyqtSignal
-from PyQt6.QtGui import QCloseEvent, QColorSpace, QMoveEvent, QShowEvent
-from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QSizePolicy, QSplitter, QTabWidget
+from PyQt6.QtCore import QByteArray, QEvent, QMutex, QMutexLocker, QObject, QThread, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QCloseEvent, QColorSpace, QMoveEvent, QResizeEvent, QScreen, QShowEvent
+from PyQt6.QtWidgets import (
+    QAbstractButton, QAbstractItemView, QAbstractSlider, QApplication, QComboBox, QDateTimeEdit, QDoubleSpinBox,
+    QLabel, QLineEdit, QMainWindow, QSizePolicy, QSpinBox, QSplitter, QTabWidget, QWidget
+)
 from vsengine import vpy  # type: ignore
 from vstools import PackageStorage, SPath, get_prop
 
@@ -29,33 +36,46 @@ from ..core import (
 from ..models import GeneralModel, SceningList, VideoOutputs
 from ..plugins import FileResolverPlugin, Plugins
 from ..shortcuts import ShortCutsSettings
-from ..toolbars import Toolbars
-from ..utils import fire_and_forget, set_status_label
+from ..toolbars import MainToolbar, Toolbars
+from ..utils import set_status_label
 from .dialog import ScriptErrorDialog, SettingsDialog
 from .settings import MainSettings, WindowSettings
 from .timeline import Timeline
 
-if sys.platform == 'win32':
-    try:
-        import win32gui  # type: ignore[import]
-
-        from PIL import _imagingcms  # type: ignore[attr-defined]
-    except ImportError:
-        _imagingcms = None
-
-    from os.path import expandvars
-else:
-    from os.path import expanduser
-
 from yaml import MarkedYAMLError, YAMLError
+from yaml.composer import ComposerError
+from yaml import dump as yaml_dump
+from yaml import load as yaml_load
 
-from ..core.bases import yaml_Dumper, yaml_Loader
+from ..core.bases import SaferLoader, yaml_Dumper, yaml_Loader
 
 __all__ = [
     'MainWindow'
 ]
 
 
+# Lib and DLLs of the running interpreter, modules under them are never hot reloaded
+_STD_PATH_LIB = os.path.dirname(os.path.dirname(logging.__file__))
+_STD_PATH_PREFIXES = tuple(
+    os.path.normcase(os.path.join(path, ''))
+    for path in (_STD_PATH_LIB, os.path.join(os.path.dirname(_STD_PATH_LIB), 'DLLs'))
+)
+
+
+@contextmanager
+def _prepended_sys_path(path: str) -> Iterator[None]:
+    sys.path.insert(0, path)
+
+    try:
+        yield
+    finally:
+        # by value, the script may have changed sys.path itself
+        try:
+            sys.path.remove(path)
+        except ValueError:
+            ...
+
+
 class CentralSplitter(QSplitter):
     def __init__(self, main_window: MainWindow, orientation: QtCore.Qt.Orientation) -> None:
         super().__init__(orientation)
@@ -77,10 +97,82 @@ class CentralSplitter(QSplitter):
         self.previous_position = self.current_position
 
 
+class StorageWriter(QObject):
+    OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+    write_requested = pyqtSignal()
+    write_blocking = pyqtSignal(list, list)
+    write_failed = pyqtSignal()
+
+    def __init__(self, thread: QThread) -> None:
+        super().__init__()
+
+        self.mutex = QMutex()
+        self.pending: tuple[list[tuple[str, str]], list[tuple[str, bytes, memoryview]]] | None = None
+
+        self.moveToThread(thread)
+
+        self.write_requested.connect(self.write_pending)
+        self.write_blocking.connect(self.write_now, QtCore.Qt.ConnectionType.BlockingQueuedConnection)
+
+    def request_write(self, backup_moves: list[tuple[str, str]], files: list[tuple[str, bytes, memoryview]]) -> None:
+        # only the newest dump is worth writing, autosaves piling up behind a slow disk just replace each other
+        with QMutexLocker(self.mutex):
+            queued = self.pending is not None
+            self.pending = (backup_moves, files)
+
+        if not queued:
+            self.write_requested.emit()
+
+    def take_pending(self) -> tuple[list[tuple[str, str]], list[tuple[str, bytes, memoryview]]] | None:
+        with QMutexLocker(self.mutex):
+            pending, self.pending = self.pending, None
+
+        return pending
+
+    def write_pending(self) -> None:
+        if (pending := self.take_pending()) is not None:
+            self.write(*pending)
+
+    def write_now(self, backup_moves: list[tuple[str, str]], files: list[tuple[str, bytes, memoryview]]) -> None:
+        # anything still pending is older than these files, without any it's just flushing the pending one
+        pending = self.take_pending()
+
+        if files:
+            self.write(backup_moves, files)
+        elif pending is not None:
+            self.write(*pending)
+
+    def write(self, backup_moves: list[tuple[str, str]], files: list[tuple[str, bytes, memoryview]]) -> None:
+        try:
+            for src_path, dest_path in backup_moves:
+                # just try the rename, a missing backup is the only expected failure
+                try:
+                    os.replace(src_path, dest_path)
+                except FileNotFoundError:
+                    pass
+
+            for path, header, content in files:
+                fd = os.open(path, self.OPEN_FLAGS, 0o666)
+
+                try:
+                    # straight to the fd, the content is already one contiguous buffer
+                    for chunk in (header, content):
+                        view = memoryview(chunk)
+
+                        while view:
+                            view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            logging.error(f'Failed to save storage:\n\n{e}')
+            self.write_failed.emit()
+
+
 class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
     VSP_DIR_NAME = 'vspreview'
     VSP_GLOBAL_DIR_NAME = SPath(
-        expandvars('%APPDATA%') if sys.platform == "win32" else expanduser('~/.config')  # type: ignore
+        os.environ.get('APPDATA' if sys.platform == 'win32' else 'XDG_CONFIG_HOME') or SPath.home() / '.config'
     )
 
     global_config_dir = VSP_GLOBAL_DIR_NAME / VSP_DIR_NAME
@@ -92,6 +184,31 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     EVENT_POLICY = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
+    # stored state lives in these widgets, their change signals (user or code driven) mark the storage dirty
+    STORAGE_CHANGE_SIGNALS: tuple[tuple[type[QWidget], str], ...] = (
+        (QAbstractButton, 'toggled'), (QComboBox, 'currentIndexChanged'), (QSpinBox, 'valueChanged'),
+        (QDoubleSpinBox, 'valueChanged'), (QDateTimeEdit, 'dateTimeChanged'), (QLineEdit, 'textChanged'),
+        (QAbstractSlider, 'valueChanged'), (QSplitter, 'splitterMoved'), (QTabWidget, 'currentChanged')
+    )
+    STORAGE_MODEL_SIGNALS = ('dataChanged', 'rowsInserted', 'rowsRemoved', 'rowsMoved', 'modelReset', 'layoutChanged')
+
+    # _PictType comes back as bytes or str depending on the VapourSynth version, None is a missing prop
+    PICT_TYPE_TEXTS: dict[str | bytes | None, str] = {
+        key: f'Type: {pict_type}' for pict_type in 'IPB' for key in (pict_type, pict_type.encode())
+    } | {None: 'Type: ?'}
+
+    STYLESHEET_EXTRA = (
+        ' QGraphicsView { border: 0px; padding: 0px; }'
+        ' QLineEdit[conflictShortcut="true"] { border: 1px solid red; }'
+    )
+
+    # the split point can never be inside the leading `_globals:` line
+    GLOBALS_KEY_LEN = len(b'_globals:')
+
+    # windows messages sent when the display setup or the assigned color profiles change
+    WM_DISPLAYCHANGE = 0x007E
+    WM_SETTINGCHANGE = 0x001A
+
     storable_attrs = ('settings', 'toolbars', 'plugins', 'shortcuts')
 
     __slots__ = (
@@ -111,6 +228,12 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     reload_stylesheet_signal = pyqtSignal()
 
+    # coalesces bursts of requests (e.g. environments being destroyed) into a single gc_collect
+    gc_requested = pyqtSignal()
+
+    # icc path, its mtime, a digest of its contents and the parsed profile, emitted from the thread pool
+    icc_profile_loaded = pyqtSignal(str, object, object, QColorSpace)
+
     toolbars: Toolbars
     plugins: Plugins
     app_settings: SettingsDialog
@@ -123,8 +246,6 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
     reload_enabled: bool
 
     def __init__(self, config_dir: SPath, no_exit: bool, reload_enabled: bool, force_storage: bool) -> None:
-        from ..toolbars import MainToolbar
-
         super().__init__()
 
         self.move_legacy_vspdir()
@@ -147,10 +268,15 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         self.last_reload_time = time()
 
         self.bound_graphics_views = dict[GraphicsView, set[GraphicsView]]()
+        self.size_policy_views = 0
+        self.graphics_views_cache = tuple[GraphicsView, ...]()
 
         self.setWindowTitle('VSPreview')
 
-        desktop_size = self.app.primaryScreen().size()
+        # QGuiApplication.primaryScreen walks the screen list, keep it and follow changes instead
+        self.primary_screen = self.app.primaryScreen()
+        self.app.primaryScreenChanged.connect(self.on_primary_screen_changed)
+        desktop_size = self.primary_screen.size()
 
         self.move(int(desktop_size.width() * 0.15), int(desktop_size.height() * 0.075))
         self.setup_ui()
@@ -175,20 +301,39 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         self.script_path = SPath()
         self.script_exec_failed = False
         self.current_storage_path = SPath()
+        self.storage_backup_moves = list[tuple[str, str]]()
+        self.last_dump_hash = b''
+        self.storage_dirs_created = False
+        self.storage_cache = dict[str, tuple[tuple[int, int], bytes]]()
+        self.stylesheet_palette: type | None = None
+
+        # hot reload
+        self.hot_reload_seen = {name for name, module in sys.modules.items() if module in PRELOADED_MODULES}
+        self.hot_reload_packages = set[str]()
 
         # timeline
         self.timeline.clicked.connect(self.on_timeline_clicked)
 
         # display profile
         self.display_profile: QColorSpace | None = None
-        self.current_screen = self.app.primaryScreen()
+        self.icc_profiles = dict[str, tuple[int, QColorSpace]]()
+        self.display_profile_path: str | None = None
+        self.icc_profiles_by_digest = dict[bytes, QColorSpace]()
+        self.current_screen = self.primary_screen
+
+        # statusbar, no frame has a type of b'' so the first frame always sets it
+        self.last_pict_type: Any = b''
 
         # init toolbars and outputs
         self.app_settings = SettingsDialog(self)
 
         Toolbars(self)
 
-        for toolbar in self.toolbars:
+        # Toolbars iterates through __getitem__, which rebuilds its key list for every index
+        self.toolbars_list = list(self.toolbars)
+        self.toolbars_rest = self.toolbars_list[1:]
+
+        for toolbar in self.toolbars_list:
             self.main_layout.addWidget(toolbar)
             self.toolbars.main.layout().addWidget(toolbar.toggle_button)
 
@@ -203,6 +348,16 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
         self.shortcuts = ShortCutsSettings(self)
 
+        self.watch_storage_changes(self)
+        self.watch_storage_changes(self.app_settings)
+
+        for plugin in self.plugins.plugins.values():
+            # plugins only build their widgets on the first load
+            plugin.on_first_load.connect(partial(self.watch_storage_changes, plugin))
+
+        self.cropValuesChanged.connect(self.mark_storage_dirty)
+        self.arValuesChanged.connect(self.mark_storage_dirty)
+
         self.set_qobject_names()
         self.setObjectName('MainWindow')
 
@@ -210,7 +365,7 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     @property
     def display_scale(self) -> float:
-        return self.app.primaryScreen().logicalDotsPerInch() / self.settings.base_ppi
+        return self.primary_screen.logicalDotsPerInch() / self.settings.base_ppi
 
     def setup_ui(self) -> None:
         self.central_widget = ExtendedWidget(self)
@@ -236,13 +391,12 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
         # status bar
         self.statusbar = StatusBar(self.central_widget)
+        self.statusbar_dirty = False
 
-        for name in self.statusbar.label_names:
-            self.statusbar.__setattr__(name, QLabel(self.central_widget))
+        labels = {name: QLabel(self.central_widget) for name in self.statusbar.label_names}
 
-        self.statusbar.addWidgets([
-            getattr(self.statusbar, name) for name in self.statusbar.label_names
-        ])
+        self.statusbar.__dict__.update(labels)
+        self.statusbar.addWidgets(list(labels.values()))
 
         self.statusbar.addPermanentWidget(self.statusbar.label)
 
@@ -251,9 +405,25 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         # dialogs
         self.script_error_dialog = ScriptErrorDialog(self)
 
-        self.autosave_timer = Timer(timeout=self.dump_storage_async)
+        self.autosave_timer = Timer(timeout=self.autosave)
         self.reload_signal.connect(self.autosave_timer.stop)
 
+        # idle autosaves can be skipped, see watch_storage_changes for what marks the storage dirty
+        self.storage_dirty = True
+
+        self.gc_timer = Timer(singleShot=True, interval=100, timeout=self.gc_collect)
+        self.screen_change_timer = Timer(singleShot=True, interval=150, timeout=self.on_window_moved)
+        self.display_change_timer = Timer(singleShot=True, interval=150, timeout=self.on_display_changed)
+        self.gc_requested.connect(self.gc_timer.start)
+        self.icc_profile_loaded.connect(self.on_icc_profile_loaded)
+
+        # storage files get written on their own thread, only the serialization needs the GUI one
+        self.storage_thread = QThread(self)
+        self.storage_writer = StorageWriter(self.storage_thread)
+        self.storage_writer.write_failed.connect(self.on_storage_write_failed)
+        self.storage_thread.start()
+        self.app.aboutToQuit.connect(self.stop_storage_thread)
+
     def auto_fit_keyswitch(self) -> None:
         for view in self.graphics_views:
             if view.underMouse():
@@ -280,11 +450,11 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
             if self.settings.dark_theme_enabled:
                 apply_plotting_style()
 
-            stylesheet = _load_stylesheet('pyqt6', palette)
-            stylesheet += ' QGraphicsView { border: 0px; padding: 0px; }'
-            stylesheet += ' QLineEdit[conflictShortcut="true"] { border: 1px solid red; }'
-
-            self.app.setStyleSheet(stylesheet)
+            # every load/reload gets here, but the sheet (and repolishing every widget
+            # with it) only has to be redone when the theme actually changed
+            if palette is not self.stylesheet_palette:
+                self.app.setStyleSheet(_load_stylesheet('pyqt6', palette) + self.STYLESHEET_EXTRA)
+                self.stylesheet_palette = palette
 
         if sys.platform == 'win32':
             self.app.setStyle("windowsvista")
@@ -315,10 +485,12 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
             )
         )
 
-        self.statusbar.label.setText('Evaluating')
-        self.script_path = script_path
+        self.statusbar.set_label_text(self.statusbar.label, 'Evaluating')
 
-        sys.path.append(str(self.script_path.parent))
+        # evaluation blocks the event loop, so paint it now or a reload never shows it
+        if self.isVisible():
+            self.statusbar.label.repaint()
+        self.script_path = script_path
 
         # Rewrite args so external args will be forwarded correctly
         argv_orig = None
@@ -329,69 +501,22 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
             pass
 
         try:
-            if reloading:
-                std_path_lib = SPath(logging.__file__).parent.parent
-                std_path_dlls = std_path_lib.parent / 'DLLs'
-
-                check_reloaded = set[str]()
-
-                for module in set(sys.modules.values()) - PRELOADED_MODULES:
-                    if not hasattr(module, '__file__') or module.__file__ is None:
-                        continue
-
-                    main_mod = module.__name__.split('.')[0]
-
-                    if main_mod in check_reloaded:
-                        continue
-
-                    mod_file = SPath(module.__file__)
-
-                    if 'vspreview' in mod_file.parts:
-                        continue
-
-                    if std_path_lib in mod_file.parents or std_path_dlls in mod_file.parents:
-                        continue
-
-                    if not mod_file.exists() or not mod_file.is_file():
-                        continue
-
-                    check_reloaded.add(main_mod)
-
-                for module in check_reloaded:
-                    all_submodules = sorted([
-                        k for k in sys.modules.keys()
-                        if k == module or k.startswith(f'{module}.')
-                    ])
-
-                    for mod_name in all_submodules:
-                        try:
-                            if SPath(sys.modules[mod_name].__file__).stat().st_mtime > self.last_reload_time:
-                                break
-                        except Exception:
-                            ...
-                    else:
-                        continue
-
-                    try:
-                        logging.info(f'Hot reloaded Python Package: "{module}"')
-                        for mod_name in reversed(all_submodules):
-                            sys.modules[mod_name] = reload_module(sys.modules[mod_name])
-                    except Exception as e:
-                        logging.error(e)
-
-            self.env = vpy.variables(
-                dict(self.external_args),
-                environment=vs.get_current_environment(),
-                module_name="__vspreview__"
-            ).result()
-            self.env.module.__dict__['_monkey_runpy'] = random()
-            self.env = vpy.script(self.script_path, environment=self.env).result()
+            with _prepended_sys_path(str(self.script_path.parent)):
+                if reloading:
+                    self.hot_reload_modules()
+
+                self.env = vpy.variables(
+                    dict(self.external_args),
+                    environment=vs.get_current_environment(),
+                    module_name="__vspreview__"
+                ).result()
+                self.env.module.__dict__['_monkey_runpy'] = random()
+                self.env = vpy.script(self.script_path, environment=self.env).result()
         except Exception as e:
             return self.handle_error(e)
         finally:
             if argv_orig is not None:
                 sys.argv = argv_orig
-            sys.path.pop()
             self.last_reload_time = time()
 
         if len(vs.get_outputs()) == 0:
@@ -402,11 +527,25 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
         reload_from_error = self.script_exec_failed and reloading
         self.script_exec_failed = False
-        self.current_storage_path = (self.current_config_dir / self.script_path.stem).with_suffix('.yml')
-
-        self.storage_not_found = not (
-            self.current_storage_path.exists() and self.current_storage_path.read_text('utf8').strip()
-        )
+        current_storage_path = (self.current_config_dir / self.script_path.stem).with_suffix('.yml')
+
+        # a reload of the same script keeps the same backups, and what was last written there still applies
+        if current_storage_path != self.current_storage_path:
+            self.current_storage_path = current_storage_path
+            # (src, dest) renames, oldest backup first, so saving is just walking them
+            storage_base = str(current_storage_path.with_suffix(''))
+            self.storage_backup_moves = [
+                (f'{storage_base}.old{i - 1}.yml' if i > 1 else f'{storage_base}.yml', f'{storage_base}.old{i}.yml')
+                for i in range(self.settings.STORAGE_BACKUPS_COUNT, 0, -1)
+            ]
+            self.last_dump_hash = b''
+            self.storage_dirs_created = False
+
+        # only whether there's anything in it matters here, load_storage is what reads it
+        try:
+            self.storage_not_found = os.path.getsize(self.current_storage_path) == 0
+        except OSError:
+            self.storage_not_found = True
 
         load_error = None
 
@@ -424,14 +563,18 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
             load_error = e
 
         if not reloading:
-            self.shortcuts.setup_shortcuts()
+            # nothing can be pressed before the event loop runs, so don't hold up the first show with them
+            QTimer.singleShot(0, self.shortcuts.setup_shortcuts)
         self.apply_stylesheet()
         self.timeline.set_sizes()
 
         with self.env:
-            vs.register_on_destroy(self.gc_collect)
+            vs.register_on_destroy(self.request_gc_collect)
 
         if load_error is None:
+            # loading the storage can swap item models (outputs, scening lists), those need connecting again
+            self.watch_storage_changes(self)
+            self.storage_dirty = True
             self.autosave_timer.start(round(float(self.settings.autosave_interval) * 1000))
 
             if not reloading:
@@ -441,7 +584,10 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         else:
             error_string = "There was an error while loading the script!\n"
 
-            logging.error(error_string + vpy.textwrap.indent(vpy.ExecutionFailed.extract_traceback(load_error), '| '))
+            if logging.getLogger().isEnabledFor(logging.ERROR):
+                logging.error(
+                    error_string + vpy.textwrap.indent(vpy.ExecutionFailed.extract_traceback(load_error), '| ')
+                )
 
             self.script_exec_failed = True
 
@@ -452,12 +598,97 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         self.show()
         self.plugins.setup_ui()
 
-    def handle_error(self, e: Exception) -> None:
-        import logging
+    def hot_reload_modules(self) -> None:
+        check_reloaded = self.hot_reload_packages
 
-        from traceback import TracebackException
+        # which package a module belongs to doesn't change, so only classify the newly imported ones
+        new_modules = sys.modules.keys() - self.hot_reload_seen
+        self.hot_reload_seen |= new_modules
+
+        for mod_name in new_modules:
+            module = sys.modules.get(mod_name)
+
+            if getattr(module, '__file__', None) is None:
+                continue
+
+            main_mod = module.__name__.split('.')[0]
+
+            if main_mod in check_reloaded:
+                continue
+
+            # normcase also makes the separators uniform on windows
+            mod_file = os.path.normcase(module.__file__)
+
+            if f'{os.sep}vspreview{os.sep}' in mod_file:
+                continue
+
+            if mod_file.startswith(_STD_PATH_PREFIXES):
+                continue
+
+            if not os.path.isfile(mod_file):
+                continue
+
+            check_reloaded.add(main_mod)
 
-        from vsengine import vpy
+        # the submodules of every package (and their files) from a single pass over sys.modules
+        package_submodules = {module: list[tuple[str, str | None]]() for module in check_reloaded}
+
+        for mod_name, mod in list(sys.modules.items()):
+            if (submodules := package_submodules.get(mod_name.partition('.')[0])) is not None:
+                submodules.append((mod_name, getattr(mod, '__file__', None)))
+
+        # the module files tracked in each directory, the only entries worth a stat there
+        dir_files = dict[str, set[str]]()
+
+        for submodules in package_submodules.values():
+            for _, mod_file in submodules:
+                if mod_file:
+                    mod_dir, mod_filename = os.path.split(mod_file)
+                    dir_files.setdefault(mod_dir, set[str]()).add(mod_filename)
+
+        dir_mtimes = dict[str, dict[str, float]]()
+
+        for module in check_reloaded:
+            all_submodules = sorted(package_submodules[module])
+
+            for mod_name, mod_file in all_submodules:
+                if not mod_file:
+                    continue
+
+                mod_dir, mod_filename = os.path.split(mod_file)
+
+                if (mtimes := dir_mtimes.get(mod_dir)) is None:
+                    filenames = dir_files[mod_dir]
+
+                    try:
+                        if len(filenames) == 1:
+                            mtimes = {mod_filename: os.stat(mod_file).st_mtime}
+                        else:
+                            # one scandir for a package directory, but a script directory or site-packages
+                            # holds plenty of unrelated files, so only the tracked ones get a stat
+                            with os.scandir(mod_dir) as entries:
+                                mtimes = {
+                                    entry.name: entry.stat().st_mtime for entry in entries if entry.name in filenames
+                                }
+                    except OSError:
+                        mtimes = {}
+
+                    dir_mtimes[mod_dir] = mtimes
+
+                if mtimes.get(mod_filename, 0.0) > self.last_reload_time:
+                    break
+            else:
+                continue
+
+            try:
+                logging.info(f'Hot reloaded Python Package: "{module}"')
+                for mod_name, _ in reversed(all_submodules):
+                    sys.modules[mod_name] = reload_module(sys.modules[mod_name])
+            except Exception as e:
+                logging.error(e)
+
+    def handle_error(self, e: Exception) -> None:
+        from traceback import TracebackException
 
         if not isinstance(e, vpy.ExecutionFailed):
             e = vpy.ExecutionFailed(e)
@@ -465,8 +696,9 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         self.hide()
         self.apply_stylesheet()
 
-        te = TracebackException.from_exception(e.parent_error)
-        logging.error(''.join(te.format()))
+        # formatting the whole traceback is only worth it if it's going to be printed
+        if logging.getLogger().isEnabledFor(logging.ERROR):
+            logging.error(''.join(TracebackException.from_exception(e.parent_error).format()))
 
         if isinstance(e.parent_error, SyntaxError) and (
             'source code string cannot contain null bytes' in str(
@@ -508,6 +740,34 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         except Exception as e:
             logging.error(f'Failed to move global storage file:\n\n{e}')
 
+    def read_storage(self, storage_path: SPath) -> bytes:
+        # kept as utf-8 bytes, libyaml decodes them itself
+        with io.open(storage_path, 'rb') as storage_file:
+            version = storage_file.readline()
+            if b'Version' not in version or any({
+                version.strip().endswith(f'@{v}'.encode()) for v in self.BREAKING_CHANGES_VERSIONS
+            }):
+                raise FileNotFoundError
+
+            return storage_file.read()
+
+    def read_storage_cached(self, storage_path: SPath) -> bytes:
+        # storages rarely change between reloads (an unchanged one isn't even rewritten),
+        # so only read them again when the file did
+        path = str(storage_path)
+        stat = os.stat(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self.storage_cache.get(path)
+
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        contents = self.read_storage(storage_path)
+        self.storage_cache[path] = (stat_key, contents)
+
+        return contents
+
     @set_status_label('Loading...')
     def load_storage(self) -> None:
         storage_paths = [self.global_storage_path, self.current_storage_path]
@@ -520,23 +780,16 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
             storage_paths = storage_paths[:1]
 
-        storage_contents = ''
+        storage_parts = list[bytes]()
+        global_part: bytes | None = None
         broken_storage = False
-        global_length = 0
         for i, storage_path in enumerate(storage_paths):
             try:
-                with io.open(storage_path, 'r', encoding='utf-8') as storage_file:
-                    version = storage_file.readline()
-                    if 'Version' not in version or any({
-                        version.strip().endswith(f'@{v}') for v in self.BREAKING_CHANGES_VERSIONS
-                    }):
-                        raise FileNotFoundError
-
-                    storage_contents += storage_file.read()
-                    storage_contents += '\n'
-
-                    if i == 0:
-                        global_length = storage_contents.count('\n')
+                storage_parts.append(self.read_storage_cached(storage_path))
+                storage_parts.append(b'\n')
+
+                if i == 0:
+                    global_part = storage_parts[0]
             except FileNotFoundError:
                 if self.settings.force_old_storages_removal or i == 0:
                     if storage_path.exists():
@@ -557,12 +810,22 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         if broken_storage:
             return
 
-        loader = yaml_Loader(storage_contents)
+        storage_contents = b''.join(storage_parts)
+
         try:
-            loader.get_single_data()
+            try:
+                yaml_load(storage_contents, Loader=yaml_Loader)
+            except ComposerError as exc:
+                # libyaml can't skip aliases whose anchor is gone (e.g. the global storage got reset)
+                if yaml_Loader is SaferLoader or exc.problem != 'found undefined alias':
+                    raise
+
+                yaml_load(storage_contents, Loader=SaferLoader)
         except YAMLError as exc:
             if isinstance(exc, MarkedYAMLError):
                 if exc.problem_mark:
+                    # lines are only needed to tell which file is broken, don't count them on every load
+                    global_length = 0 if global_part is None else global_part.count(b'\n') + 1
                     line = exc.problem_mark.line + 1
                     isglobal = line <= global_length
                     if not isglobal:
@@ -577,63 +840,128 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
                         .format(
                             'Global' if isglobal else 'Local',
                             line, exc.problem_mark.column + 1,
-                            str(exc).partition('in "<unicode string>"')[0].strip(),
+                            str(exc).partition('in "<byte string>"')[0].strip(),
                             '\n'.join(str(p) for p in storage_paths)
                         )
                     )
                     sys.exit(1)
             else:
                 logging.warning('Storage parsing failed. Using defaults.')
-        finally:
-            loader.dispose()
 
         if self.settings.color_management:
             assert self.app
-            self.current_screen = self.app.primaryScreen()
+            self.current_screen = self.window_screen()
             self.update_display_profile()
 
-    @set_status_label('Saving storage...', 'Storage saved successfully!')
-    @fire_and_forget
-    def dump_storage_async(self) -> None:
-        self.dump_storage()
+    def watch_storage_changes(self, root: QWidget) -> None:
+        for widget in (root, *root.findChildren(QWidget)):
+            if not widget.property('storageWatched'):
+                widget.setProperty('storageWatched', True)
+
+                for widget_type, signal_name in self.STORAGE_CHANGE_SIGNALS:
+                    if isinstance(widget, widget_type):
+                        getattr(widget, signal_name).connect(self.mark_storage_dirty)
+
+            if isinstance(widget, (QComboBox, QAbstractItemView)):
+                model = widget.model()
+
+                if model is not None and not model.property('storageWatched'):
+                    model.setProperty('storageWatched', True)
 
-    def dump_storage(self) -> None:
-        from itertools import count
+                    for signal_name in self.STORAGE_MODEL_SIGNALS:
+                        getattr(model, signal_name).connect(self.mark_storage_dirty)
 
+    def mark_storage_dirty(self, *args: Any) -> None:
+        self.storage_dirty = True
+
+    def autosave(self) -> None:
+        if self.storage_dirty:
+            self.dump_storage_async(only_if_changed=True)
+
+    @set_status_label('Saving storage...', 'Storage saved successfully!')
+    def dump_storage_async(self, only_if_changed: bool = False) -> None:
+        self.dump_storage(True, only_if_changed)
+
+    def dump_storage(self, in_background: bool = False, only_if_changed: bool = False) -> None:
         if self.script_exec_failed:
+            if not in_background:
+                self.flush_storage_writes()
             return
 
-        self.current_config_dir.mkdir(0o777, True, True)
-        self.global_config_dir.mkdir(0o777, True, True)
+        self.storage_dirty = False
 
-        backup_paths = [
-            self.current_storage_path.with_suffix(f'.old{i}.yml')
-            for i in range(self.settings.STORAGE_BACKUPS_COUNT, 0, -1)
-        ] + [self.current_storage_path]
+        data = self._serialize_data()
+        # libyaml emits utf-8 natively, ask for bytes rather than encoding a str afterwards
+        storage_dump = yaml_dump(
+            data, Dumper=yaml_Dumper, default_flow_style=False, indent=4,
+            width=120, allow_unicode=True, line_break='\n', encoding='utf-8', sort_keys=True
+        )
 
-        for src_path, dest_path in zip(backup_paths[1:], backup_paths[:-1]):
-            if src_path.exists():
-                src_path.replace(dest_path)
+        # nothing changed since the last autosave, don't rotate the backups for an identical file;
+        # explicit saves always write, the files could have been edited or removed in the meantime
+        dump_hash = blake2b(storage_dump, digest_size=16).digest()
 
-        storage_dump = self._dump_serialize(self._serialize_data()).splitlines()
+        if only_if_changed and dump_hash == self.last_dump_hash:
+            # blocking callers read the storage back right after, a queued autosave has to be on disk by then
+            if not in_background:
+                self.flush_storage_writes()
+            return
 
-        idx = next(idx for (line, idx) in zip(storage_dump[2:], count(2)) if not line.startswith(' '))
+        if not self.storage_dirs_created:
+            self.current_config_dir.mkdir(0o777, True, True)
+            self.global_config_dir.mkdir(0o777, True, True)
+            self.storage_dirs_created = True
+
+        # keys are emitted sorted and _globals comes first, so the local storage starts at the key after it
+        idx = storage_dump.index(f'\n{sorted(data)[1]}:'.encode('utf-8'), self.GLOBALS_KEY_LEN) + 1
+
+        version = f'# Version@{self.VSP_VERSION}\n'
+
+        # both halves are views on the one encoded dump, nothing gets copied until it hits the file
+        dump_view = memoryview(storage_dump)
+
+        files = [
+            (
+                str(self.global_storage_path),
+                f'{version}# Global VSPreview storage for settings\n'.encode('utf-8'),
+                dump_view[:idx]
+            ),
+            (
+                str(self.current_storage_path),
+                f'{version}# VSPreview local storage for script: {self.script_path}\n'
+                f'# Global setting (storage/plugins) saved at path: {self.global_config_dir}\n'.encode('utf-8'),
+                dump_view[idx:]
+            )
+        ]
 
-        version = f'# Version@{self.VSP_VERSION}'
+        self.last_dump_hash = dump_hash
 
-        with io.open(self.global_storage_path, 'w', encoding='utf-8') as global_file:
-            global_file.writelines(
-                '\n'.join([version, '# Global VSPreview storage for settings'] + storage_dump[:idx])
-            )
+        if not self.storage_thread.isRunning():
+            self.storage_writer.write(self.storage_backup_moves, files)
+        elif in_background:
+            self.storage_writer.request_write(self.storage_backup_moves, files)
+        else:
+            # queued behind any pending autosave, so the two never write the same files at once
+            self.storage_writer.write_blocking.emit(self.storage_backup_moves, files)
 
-        with io.open(self.current_storage_path, 'w', encoding='utf-8') as current_file:
-            current_file.writelines(
-                '\n'.join([
-                    version,
-                    f'# VSPreview local storage for script: {self.script_path}',
-                    f'# Global setting (storage/plugins) saved at path: {self.global_config_dir}'
-                ] + storage_dump[idx:])
-            )
+    def on_storage_write_failed(self) -> None:
+        self.last_dump_hash = b''
+        self.storage_dirs_created = False
+        self.storage_dirty = True
+
+    def flush_storage_writes(self) -> None:
+        # an empty blocking write only returns once the pending autosave has been written
+        if self.storage_thread.isRunning():
+            self.storage_writer.write_blocking.emit([], [])
+
+    def stop_storage_thread(self) -> None:
+        if not self.storage_thread.isRunning():
+            return
+
+        self.flush_storage_writes()
+
+        self.storage_thread.quit()
+        self.storage_thread.wait()
 
     def _serialize_data(self) -> Any:
         # idk how to explain how this work,
@@ -675,24 +1003,6 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
         return data
 
-    def _dump_serialize(self, data: Any) -> str:
-        storage_dump = io.StringIO()
-
-        dumper = yaml_Dumper(
-            storage_dump, default_style=None, default_flow_style=False,
-            canonical=None, indent=4, width=120, allow_unicode=True,
-            line_break='\n', encoding='utf-8', version=None, tags=None,
-            explicit_start=None, explicit_end=None, sort_keys=True
-        )
-        try:
-            dumper.open()
-            dumper.represent(data)
-            dumper.close()
-        finally:
-            dumper.dispose()
-
-        return storage_dump.getvalue()
-
     def init_outputs(self) -> None:
         if not self.outputs:
             return
@@ -731,8 +1041,6 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         if self.outputs:
             self.outputs.clear()
 
-        self.gc_collect()
-
     def reload_script(self) -> None:
         self.reload_before_signal.emit()
 
@@ -745,11 +1053,21 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         self.clear_monkey_runpy()
         make_environment()
         dispose_environment(old_environment)
+
+        # one collection once the old environment is gone frees both it and the cleared references
         self.gc_collect()
 
+        gc_enabled = gc.isenabled()
+
+        # the script allocates a lot while it's being evaluated, don't let that trigger collections midway
+        gc.disable()
+
         try:
             self.load_script(self.script_path, self.external_args, True, None, self.display_name)
         finally:
+            if gc_enabled:
+                gc.enable()
+
             self.clear_monkey_runpy()
 
         self.reload_after_signal.emit()
@@ -758,25 +1076,28 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     def clear_monkey_runpy(self) -> None:
         if self.env and '_monkey_runpy' in self.env.module.__dict__:
-            key = self.env.module.__dict__['_monkey_runpy']
+            env_dict = _monkey_runpy_dicts.pop(self.env.module.__dict__['_monkey_runpy'], None)
 
-            if key in _monkey_runpy_dicts:
-                _monkey_runpy_dicts[key].clear()
-                _monkey_runpy_dicts.pop(key, None)
+            if env_dict is not None:
+                env_dict.clear()
             elif _monkey_runpy_dicts:
                 for env in _monkey_runpy_dicts.values():
                     env.clear()
                 _monkey_runpy_dicts.clear()
 
-        self.gc_collect()
-
-    def gc_collect(self) -> None:
-        import gc
+        self.gc_requested.emit()
 
-        for i in range(3):
-            gc.collect(generation=i)
+    def request_gc_collect(self) -> None:
+        try:
+            self.gc_requested.emit()
+        except RuntimeError:
+            # the window is already gone when cores get freed on shutdown
+            self.gc_collect()
 
-        for _ in range(3):
+    def gc_collect(self) -> None:
+        # a full collection already covers every generation,
+        # the second one only picks up what got freed by finalizers/weakref callbacks
+        if gc.collect():
             gc.collect()
 
     def switch_frame(
@@ -784,64 +1105,87 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
     ) -> None:
         frame = Frame(pos)
 
-        if (not 0 <= frame < self.current_output.total_frames):
+        # current_output goes through the outputs combobox every time
+        current_output = self.current_output
+
+        if (not 0 <= frame < current_output.total_frames):
             return
 
         if render_frame:
             if isinstance(render_frame, bool):
-                self.current_output.render_frame(frame, output_colorspace=self.display_profile)
+                current_output.render_frame(frame, output_colorspace=self.display_profile)
             else:
-                self.current_output.render_frame(
+                current_output.render_frame(
                     frame, *render_frame, output_colorspace=self.display_profile  # type: ignore
                 )
 
-        self.current_output.last_showed_frame = frame
+        current_output.last_showed_frame = frame
+        self.storage_dirty = True
 
         self.timeline.cursor_x = frame
 
-        for toolbar in self.toolbars:
+        for toolbar in self.toolbars_list:
             toolbar.on_current_frame_changed(frame)
 
         self.plugins.on_current_frame_changed(frame)
 
-        self.statusbar.frame_props_label.setText(
-            f"Type: {get_prop(self.current_output.props, '_PictType', str, None, '?')}"
-        )
+        props = current_output.props
+        pict_type = props.get('_PictType') if props else None
+
+        # frame types come in runs, skip the text lookup entirely while it stays the same
+        if pict_type != self.last_pict_type:
+            self.last_pict_type = pict_type
+
+            props_text = self.PICT_TYPE_TEXTS.get(pict_type)
+
+            if props_text is None:
+                # anything that isn't a plain I/P/B
+                props_text = f"Type: {get_prop(props, '_PictType', str, None, '?')}"
+
+            self.statusbar.set_label_text(self.statusbar.frame_props_label, props_text)
 
     def switch_output(self, value: int | VideoOutput) -> None:
-        if not self.outputs or len(self.outputs) == 0:
+        outputs = self.outputs
+
+        if not outputs:
             return
 
+        n_outputs = len(outputs)
+
         if isinstance(value, VideoOutput):
-            index = self.outputs.index_of(value)
+            index = outputs.index_of(value)
         else:
             index = value
 
         if index < 0:
-            index = len(self.outputs) + index
+            index = n_outputs + index
 
-        if index < 0 or index >= len(self.outputs):
+        if index < 0 or index >= n_outputs:
             return
 
-        prev_index = self.toolbars.main.outputs_combobox.currentIndex()
+        main_toolbar = self.toolbars.main
+
+        prev_index = main_toolbar.outputs_combobox.currentIndex()
 
         self.toolbars.playback.stop()
 
         # current_output relies on outputs_combobox
-        self.toolbars.main.on_current_output_changed(index, prev_index)
+        main_toolbar.on_current_output_changed(index, prev_index)
+
+        current_output = self.current_output
 
-        self.switch_frame(self.current_output.last_showed_frame)
+        self.switch_frame(current_output.last_showed_frame)
 
         self.refresh_graphics_views()
 
         self.timeline.update_notches()
 
-        for toolbar in self.toolbars[1:]:
+        for toolbar in self.toolbars_rest:
             toolbar.on_current_output_changed(index, prev_index)
 
         self.plugins.on_current_output_changed(index, prev_index)
 
-        self.update_statusbar_output_info()
+        self.update_statusbar_output_info(current_output)
 
     def refresh_graphics_views(self) -> None:
         for graphics_view in self.graphics_views:
@@ -849,7 +1193,15 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     @property
     def current_output(self) -> VideoOutput:
-        return cast(VideoOutput, self.toolbars.main.outputs_combobox.currentData())
+        main_toolbar = self.toolbars.main
+
+        # the outputs the combobox shows, read directly rather than through currentData() and a QVariant
+        if (outputs := main_toolbar.outputs) is None:
+            return cast(VideoOutput, None)
+
+        index = main_toolbar.outputs_combobox.currentIndex()
+
+        return outputs.items[index] if 0 <= index < len(outputs.items) else cast(VideoOutput, None)
 
     @property
     def outputs(self) -> VideoOutputs | None:
@@ -860,12 +1212,15 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         return self.graphics_view.current_scene
 
     @property
-    def graphics_views(self) -> list[GraphicsView]:
-        return list(self.bound_graphics_views.keys())
+    def graphics_views(self) -> tuple[GraphicsView, ...]:
+        return self.graphics_views_cache
 
     def register_graphic_view(self, view: GraphicsView) -> None:
         self.bound_graphics_views[view] = {view}
 
+        # views only ever get registered, never removed, so this is the only place the keys change
+        self.graphics_views_cache = tuple(self.bound_graphics_views)
+
         view.zoom_combobox.currentTextChanged.connect(partial(self.on_zoom_changed, bound_view=view))
 
         view.zoom_combobox.setModel(GeneralModel[float](self.settings.zoom_levels))
@@ -875,8 +1230,13 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
         if not bound_view:
             return
 
-        for view in self.bound_graphics_views[bound_view]:
-            view.setZoom(bound_view.zoom_combobox.currentData())
+        zoom = bound_view.zoom_combobox.currentData()
+        bound_views = self.bound_graphics_views
+
+        # GraphicsView.setZoom already spreads to its own bound views, going through it for every
+        # view bound to this one would zoom each of them once per binding they share
+        for view in {view for other in bound_views[bound_view] for view in bound_views[other]}:
+            view._setZoom(zoom)
 
     def handle_script_error(self, message: str, script: bool = False) -> None:
         self.clear_monkey_runpy()
@@ -894,55 +1254,94 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
 
     def update_display_profile(self) -> None:
         if sys.platform == 'win32':
-            assert self.app and _imagingcms
+            # only needed with color management on, so PIL isn't imported on every startup
+            import win32api  # type: ignore[import]
+            import win32con  # type: ignore[import]
+            import win32gui  # type: ignore[import]
+
+            from PIL import _imagingcms  # type: ignore[attr-defined]
 
-            screen_name = self.current_screen.name()
+            assert self.app
 
-            dc = win32gui.CreateDC('DISPLAY', screen_name, None)
+            logging.info(f'Changed screen: {self.current_screen.name()}')
 
-            logging.info(f'Changed screen: {screen_name}')
+            # ask for the monitor the window is actually on rather than trusting the QScreen name
+            monitor = win32api.MonitorFromWindow(int(self.winId()), win32con.MONITOR_DEFAULTTONEAREST)
 
-            icc_path = _imagingcms.get_display_profile_win32(dc, 1)
+            dc = win32gui.CreateDC('DISPLAY', win32api.GetMonitorInfo(monitor)['Device'], None)
+
+            try:
+                icc_path = _imagingcms.get_display_profile_win32(dc, 1)
+            finally:
+                win32gui.DeleteDC(dc)
 
             if icc_path is not None:
-                with open(icc_path, 'rb') as icc:
-                    self.display_profile = QColorSpace.fromIccProfile(icc.read())
+                self.display_profile_path = icc_path
+
+                # moving between monitors keeps coming back to the same few profiles, parse each one once
+                icc_mtime = os.stat(icc_path).st_mtime_ns
+
+                if (cached := self.icc_profiles.get(icc_path)) is not None and cached[0] == icc_mtime:
+                    self.set_display_profile(cached[1])
+                else:
+                    # reading and parsing a profile can take a while, don't block the window drag on it
+                    QThreadPool.globalInstance().start(partial(self.load_icc_profile, icc_path, icc_mtime))
+
+    def load_icc_profile(self, icc_path: str, icc_mtime: int) -> None:
+        try:
+            with open(icc_path, 'rb') as icc:
+                icc_data = icc.read()
+        except OSError as e:
+            return logging.warning(f'Failed to read the display profile {icc_path}: {e}')
+
+        self.icc_profile_loaded.emit(
+            icc_path, icc_mtime, blake2b(icc_data, digest_size=8).digest(), QColorSpace.fromIccProfile(icc_data)
+        )
+
+    def on_icc_profile_loaded(self, icc_path: str, icc_mtime: int, digest: bytes, profile: QColorSpace) -> None:
+        # monitors sharing a profile (or a rewritten file with the same bytes) share the same object,
+        # so set_display_profile sees it as unchanged and skips redecoding the frame
+        profile = self.icc_profiles_by_digest.setdefault(digest, profile)
+
+        self.icc_profiles[icc_path] = (icc_mtime, profile)
 
-        if hasattr(self, 'current_output') and self.current_output is not None and self.display_profile is not None:
+        # the window might have been moved to another monitor in the meantime
+        if icc_path == self.display_profile_path:
+            self.set_display_profile(profile)
+
+    def set_display_profile(self, profile: QColorSpace) -> None:
+        # a screen with the same profile renders the same, no need to redecode the frame
+        if profile is self.display_profile:
+            return
+
+        self.display_profile = profile
+
+        if hasattr(self, 'current_output') and self.current_output is not None:
             self.switch_frame(self.current_output.last_showed_frame)
 
     def show_message(self, message: str) -> None:
         self.statusbar.clearMessage()
-        self.statusbar.showMessage(
-            message, round(float(self.settings.statusbar_message_timeout) * 1000)
-        )
+        self.statusbar.showMessage(message, self.settings.statusbar_message_timeout_ms)
 
     def update_statusbar_output_info(self, output: VideoOutput | None = None) -> None:
-        output = output or self.current_output
-        fmt = output.source.clip.format
-        assert fmt
+        statusbar = self.statusbar
 
-        self.statusbar.clearMessage()
-
-        self.statusbar.total_frames_label.setText(f'{output.total_frames} frames ')
-        self.statusbar.duration_label.setText(f'{output.total_time} ')
-        self.statusbar.resolution_label.setText(f'{output.width}x{output.height} ')
-        self.statusbar.pixel_format_label.setText(f'{fmt.name} ')
+        # nobody sees the labels, showEvent fills them in for the current output
+        if not statusbar.isVisible():
+            self.statusbar_dirty = True
+            return
 
-        if output.got_timecodes:
-            times = sorted(set(output.timecodes), reverse=True)
+        self.statusbar_dirty = False
 
-            if len(times) >= 2:
-                return self.statusbar.fps_label.setText(
-                    f'VFR {",".join(f"{float(fps):.3f}" for fps in times)} fps '
-                )
+        output = output or self.current_output
 
-        if output.fps_den != 0:
-            return self.statusbar.fps_label.setText(
-                f'{output.fps_num}/{output.fps_den} = {output.fps_num / output.fps_den:.3f} fps '
-            )
+        statusbar.clearMessage()
 
-        self.statusbar.fps_label.setText(f'VFR {output.fps_num}/{output.fps_den} fps ')
+        for label, text in zip((
+            statusbar.total_frames_label, statusbar.duration_label, statusbar.resolution_label,
+            statusbar.pixel_format_label, statusbar.fps_label
+        ), output.statusbar_texts):
+            statusbar.set_label_text(label, text)
 
     def set_temporary_scenes(self, scenes: list[SceningList]) -> None:
         self.temporary_scenes = scenes
@@ -971,27 +1370,83 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
     # misc methods
     def showEvent(self, event: QShowEvent) -> None:
         super().showEvent(event)
-        for graphics_view in self.graphics_views:
-            graphics_view.setSizePolicy(self.EVENT_POLICY)
 
-        self.main_split.setSizePolicy(self.EVENT_POLICY)
+        # views are only ever appended, the ones that already got the policy on a previous show keep it
+        if self.size_policy_views < len(self.graphics_views):
+            for graphics_view in self.graphics_views[self.size_policy_views:]:
+                graphics_view.setSizePolicy(self.EVENT_POLICY)
+
+            if not self.size_policy_views:
+                self.main_split.setSizePolicy(self.EVENT_POLICY)
+
+            self.size_policy_views = len(self.graphics_views)
+
+        if self.statusbar_dirty and self.current_output is not None:
+            self.update_statusbar_output_info()
 
     def closeEvent(self, event: QCloseEvent) -> None:
         if self.settings.autosave_control.value() != Time(seconds=0):
-            self.dump_storage_async()
+            self.dump_storage()
+
+        self.stop_storage_thread()
 
         self.reload_signal.emit()
 
+        # removing temporary scripts and folders can take a while, don't keep the window on screen meanwhile
+        if self.resolve_plugins:
+            self.hide()
+
         for file_resolve_plugin in self.resolve_plugins:
             file_resolve_plugin.cleanup()
 
-    def moveEvent(self, _move_event: QMoveEvent) -> None:
+    def on_primary_screen_changed(self, screen: QScreen) -> None:
+        self.primary_screen = screen
+
+    def nativeEvent(self, event_type: QByteArray | bytes, message: Any) -> tuple[bool, Any]:
+        if sys.platform == 'win32' and event_type == b'windows_generic_MSG':
+            from ctypes import wintypes, wstring_at
+
+            msg = wintypes.MSG.from_address(int(message))
+
+            # a profile reassigned in the color management panel is announced with an "ICM" setting change
+            if msg.message == self.WM_DISPLAYCHANGE or (
+                msg.message == self.WM_SETTINGCHANGE and msg.lParam and wstring_at(msg.lParam) == 'ICM'
+            ):
+                self.display_change_timer.start()
+
+        return super().nativeEvent(event_type, message)
+
+    def on_display_changed(self) -> None:
         if self.settings.color_management:
-            assert self.app
-            screen_number = self.app.primaryScreen()
-            if self.current_screen != screen_number:
-                self.current_screen = screen_number
-                self.update_display_profile()
+            self.update_display_profile()
+
+    def moveEvent(self, move_event: QMoveEvent) -> None:
+        # the window geometry is stored too
+        self.storage_dirty = True
+
+        if self.settings.color_management:
+            # a drag sends a move event per step, only look at the screen once the window settles
+            self.screen_change_timer.start()
+
+    def resizeEvent(self, resize_event: QResizeEvent) -> None:
+        self.storage_dirty = True
+
+        super().resizeEvent(resize_event)
+
+    def on_window_moved(self) -> None:
+        if not self.settings.color_management:
+            return
+
+        assert self.app
+
+        screen_number = self.window_screen()
+        if self.current_screen != screen_number:
+            self.current_screen = screen_number
+            self.update_display_profile()
+
+    def window_screen(self) -> QScreen:
+        # the primary screen stays the same wherever the window goes, look at where it actually is
+        return self.app.screenAt(self.frameGeometry().center()) or self.screen()
 
     def refresh_video_outputs(self) -> None:
         if not self.outputs:
@@ -1010,6 +1465,8 @@ class MainWindow(AbstractQItem, QMainWindow, QAbstractYAMLObjectSingleton):
             self.toolbars.playback.play()
 
     def __getstate__(self) -> dict[str, Any]:
-        return super().__getstate__() | {
-            'window_settings': self.window_settings
-        }
+        # the base state is a fresh dict already, no need to merge into another one
+        state = super().__getstate__()
+        state['window_settings'] = self.window_settings
+
+        return state
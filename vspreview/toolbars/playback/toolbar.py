@@ -228,7 +228,7 @@ class PlaybackToolbar(AbstractToolbar):
             return
 
         if self.main.statusbar.label.text() == 'Ready':
-            self.main.statusbar.label.setText('Playing')
+            self.main.statusbar.set_label_text(self.main.statusbar.label, 'Playing')
 
         if self.main.current_output.prepared.alpha is None:
             self.allocate_buffer(False)
@@ -390,7 +390,7 @@ class PlaybackToolbar(AbstractToolbar):
             self.play_end_time = perf_counter_ns()
             self.play_end_frame = Frame(self.main.current_output.last_showed_frame)
         if self.main.statusbar.label.text() == 'Playing':
-            self.main.statusbar.label.setText('Ready')
+            self.main.statusbar.set_label_text(self.main.statusbar.label, 'Ready')
 
         for future in self.play_buffer:
             future[1].add_done_callback(_del_future)
@@ -187,7 +187,7 @@ class SceningToolbar(AbstractToolbar):
             return marks
 
         for scene in self.current_list:
-            marks.add(scene, cast(QColor, Qt.GlobalColor.green))
+            marks.add_scene(scene, cast(QColor, Qt.GlobalColor.green))
 
         return marks
 